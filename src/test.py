@@ -1,10 +1,37 @@
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore
 from PyQt5.QtWidgets import QApplication, QMainWindow
 import sys
+import os
+import atexit
+import importlib.util
+import logging
+import logging.handlers
+import queue
 from window import Ui_MainWindow
 import pyqtgraph as pg
 import numpy as np
 
+log = logging.getLogger(__name__)
+_log_listener = None
+
+# must be set before any PlotWidget is created; numba is optional.
+# enableExperimental also selects the faster in-place arrayToQPath, which
+# works without GL. OpenGL is opt-in (ENMOVITO_OPENGL=1) since hosts
+# without a usable GL context (VMs, RDP, offscreen) would get a blank plot
+_USE_OPENGL = os.environ.get('ENMOVITO_OPENGL') == '1'
+pg.setConfigOptions(useOpenGL=_USE_OPENGL, enableExperimental=True, antialias=False,
+                    useNumba=importlib.util.find_spec('numba') is not None)
+
+# demo data is fixed, so compute it once and share the read-only buffers
+_X = np.linspace(0, 10, 100, dtype=np.float32)
+_Y = np.sin(_X)
+_X.setflags(write=False)
+_Y.setflags(write=False)
+
+# streaming buffer size; the oldest quarter is dropped when it fills up
+MAX_POINTS = 4096
+_CHUNK = MAX_POINTS // 4
+
 class App(Ui_MainWindow):
     def __init__(self, win):
         super().__init__()
@@ -13,27 +40,77 @@ class App(Ui_MainWindow):
 
         # Create a plot widget
         self.plot_widget = pg.PlotWidget()
+        # render cost scales with pixels, not samples
+        self.plot_widget.setDownsampling(auto=True, mode='peak')
+        self.plot_widget.setClipToView(True)
         
         # Add the plot widget to the central widget layout
         self.centralwidget.layout().addWidget(self.plot_widget)
+
+        # Line curve, updated in place via setData; a PlotDataItem is needed
+        # for the downsampling and clipping set above
+        self.curve = self.plot_widget.plot(pen='y')
+
+        # Preallocated buffers for streamed points, see add_point; time is
+        # float64 so timestamps keep sub-second resolution
+        self._t = np.empty(MAX_POINTS, dtype=np.float64)
+        self._v = np.empty(MAX_POINTS, dtype=np.float32)
+        self._n = 0
         
-        # Plot some data
-        self.plot_data()
+        # Plot some data once the window has been shown and laid out
+        QtCore.QTimer.singleShot(0, self.plot_data)
 
     def on_click(self):
-        print('PyQt5 button click')
+        log.info('PyQt5 button click')
 
     def plot_data(self):
-        # Generate some data
-        x = np.linspace(0, 10, 100)
-        y = np.sin(x)
-        
-        # Plot the data
-        self.plot_widget.plot(x, y)
+        # Runs deferred from the event loop; if points were streamed in via
+        # add_point before that, keep them instead of the demo curve
+        if self._n:
+            return
+        self.curve.setData(_X, _Y)
+
+    def add_point(self, t, v):
+        if self._n == MAX_POINTS:
+            # shift out the oldest chunk instead of growing the arrays
+            self._t[:-_CHUNK] = self._t[_CHUNK:]
+            self._v[:-_CHUNK] = self._v[_CHUNK:]
+            self._n -= _CHUNK
+        self._t[self._n] = t
+        self._v[self._n] = v
+        self._n += 1
+        self.curve.setData(self._t[:self._n], self._v[:self._n])
+
+
+def _setup_logging():
+    # log records are written to stdout by a listener thread, not the GUI
+    # thread; only this module's logger is routed, and only once
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 
 
 def window():
-    app = QApplication(sys.argv)
+    app = QApplication.instance()
+    if app is None:
+        # attributes must be set before the application is created.
+        # AA_DisableHighDpiScaling overrides the user's scaling env vars, so
+        # only set it when the user has not opted in to high-DPI scaling
+        if not ('QT_AUTO_SCREEN_SCALE_FACTOR' in os.environ
+                or 'QT_ENABLE_HIGHDPI_SCALING' in os.environ):
+            QApplication.setAttribute(QtCore.Qt.AA_DisableHighDpiScaling, True)
+        # already the Qt 5.15 default; only pins it
+        QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, False)
+        app = QApplication(sys.argv)
+
+    _setup_logging()
 
     #with open('SyNet.qss', 'r') as f:
     #    app.setStyleSheet(f.read())
@@ -45,5 +122,7 @@ def window():
 
     win.showMaximized()
     sys.exit(app.exec_())
-     
-window() 
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    window()